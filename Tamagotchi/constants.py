@@ -2,9 +2,12 @@
 SCREEN_WIDTH = 480          
 SCREEN_HEIGHT = 320
 FPS = 30
+FIXED_DT = 1.0 / FPS        # Minigame simulation step, independent of how long a frame took
+MAX_STEPS_PER_FRAME = 5     # Cap on catch-up steps after a slow frame
 DB_FILE = "pet_life.db"
 TIME_SCALE_FACTOR = 1 # 1 = real time, 10 = 10x faster!
 POINTS_PER_WIN = 10
+DEBUG = False               # Print state-transition traces to the console
 
 # --- SHOP (Prices in Coins) ---
 SHOP_ITEMS = {
@@ -3,11 +3,18 @@ import time
 
 class DatabaseManager:
     """Handles SQL persistence to keep the pet 'alive' on disk."""
-    def __init__(self, db_path):
+    def __init__(self, db_path, initialize=True):
+        self.db_path = db_path
         self.conn = sqlite3.connect(db_path)
-        self.create_tables()
-        self._initialize_items()
-        self._initialize_plants()
+        # NORMAL only syncs at WAL checkpoints, so commits are cheap on SD cards (per connection)
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._inventory_cache = None # Rows of the last get_inventory(), cleared whenever the inventory changes
+        if initialize: # Extra connections (e.g. the pet save thread) reuse the schema the main one set up
+            # WAL is stored in the file, so it is switched on once here before any other connection opens
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.create_tables()
+            self._initialize_items()
+            self._initialize_plants()
 
     def create_tables(self):
         """Creates the 14-column schema, now including pet name and points."""
@@ -105,9 +112,11 @@ class DatabaseManager:
             self.conn.commit()
 
     def get_inventory(self):
-        """Retrieves the player's inventory."""
-        cursor = self.conn.execute("SELECT i.name, inv.quantity, i.description, i.effect_stat, i.effect_value FROM inventory inv JOIN items i ON inv.item_id = i.id")
-        return cursor.fetchall()
+        """Retrieves the player's inventory. Served from memory until the inventory is modified."""
+        if self._inventory_cache is None:
+            cursor = self.conn.execute("SELECT i.name, inv.quantity, i.description, i.effect_stat, i.effect_value FROM inventory inv JOIN items i ON inv.item_id = i.id")
+            self._inventory_cache = cursor.fetchall()
+        return list(self._inventory_cache)
 
     def add_item_to_inventory(self, item_name, quantity=1):
         """Adds a specified quantity of an item to the inventory."""
@@ -122,6 +131,7 @@ class DatabaseManager:
             else:
                 self.conn.execute("INSERT INTO inventory (item_id, quantity) VALUES (?, ?)", (item_id[0], quantity))
             self.conn.commit()
+            self._inventory_cache = None
 
     def remove_item_from_inventory(self, item_name, quantity=1):
         """Removes a specified quantity of an item from the inventory."""
@@ -137,6 +147,7 @@ class DatabaseManager:
                 else:
                     self.conn.execute("DELETE FROM inventory WHERE item_id = ?", (item_id[0],))
                 self.conn.commit()
+                self._inventory_cache = None
                 return True
         return False
 
@@ -1,26 +1,24 @@
 import pygame
 import time
 from constants import *
+from models import GardenPlot
+from ui_helpers import is_primary_click, render_text
 
 class GardeningGame:
     def __init__(self, font, db):
         self.font = font
         self.db = db
         self.is_over = False
+        self._plant_cache = {} # Plant metadata is static for the session
+        self._last_update = 0.0
         
-        plots_dict = {}
-        db_plots = self.db.get_garden_plots()
-        for plot in db_plots:
-            plots_dict[plot[0]] = plot
-
+        existing_plot_ids = {plot[0] for plot in self.db.get_garden_plots()}
         for i in range(1, 5):
-            if i not in plots_dict:
+            if i not in existing_plot_ids:
                 self.db.plant_seed(i, None)
-                new_plot = self.db.conn.execute("SELECT * FROM garden_plots WHERE plot_id = ?", (i,)).fetchone()
-                plots_dict[i] = new_plot
-        
-        self.plots = [plots_dict[i] for i in sorted(plots_dict.keys())]
-            
+
+        self._refresh_plots()
+
         self.plot_rects = [
             pygame.Rect(50, 80, 150, 150),
             pygame.Rect(280, 80, 150, 150),
@@ -30,93 +28,115 @@ class GardeningGame:
         self.selected_plot = None
         self.close_button = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 40, 100, 30)
 
+    def _refresh_plots(self):
+        """Re-reads the garden plots once, ordered by plot_id. Only needed after a plot changes."""
+        rows = sorted(self.db.get_garden_plots(), key=lambda plot: plot[0])
+        self.plots = [GardenPlot(*row) for row in rows]
+        for plot in self.plots:
+            plant_info = self._get_plant_info(plot.plant_id) if plot.plant_id else None
+            if plant_info:
+                plot.ready_time = plot.plant_time + plant_info[3]
+        self._update_growth(time.time())
+
+    def _update_growth(self, now):
+        """Recomputes the cached growth bar and watering state that draw() reads."""
+        for plot in self.plots:
+            plant_info = self._get_plant_info(plot.plant_id) if plot.plant_id else None
+            if plant_info:
+                growth_time_seconds = plant_info[3]
+                plot.growth_pct = min(1, (now - plot.plant_time) / growth_time_seconds)
+                plot.needs_water = now - plot.last_watered_time > 3600 # 1 hour
+            else:
+                plot.growth_pct = 0.0
+                plot.needs_water = False
+
+    def _get_plant_info(self, plant_id):
+        """Returns the plants row for plant_id, querying the database only the first time."""
+        if plant_id not in self._plant_cache:
+            self._plant_cache[plant_id] = self.db.get_plant(plant_id)
+        return self._plant_cache[plant_id]
+
     def handle_event(self, event, raw_pos):
-        click_pos = None
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            click_pos = raw_pos
-        elif event.type == pygame.FINGERDOWN:
-            click_pos = raw_pos
+        if not is_primary_click(event):
+            return
+        click_pos = raw_pos
 
-        if click_pos:
-            if self.close_button.collidepoint(click_pos):
-                self.is_over = True
-                return
+        if self.close_button.collidepoint(click_pos):
+            self.is_over = True
+            return
 
-            for i, rect in enumerate(self.plot_rects):
-                if rect.collidepoint(click_pos):
-                    self.selected_plot = i + 1
-                    return
-            
-            if self.selected_plot:
-                if not self.plots[self.selected_plot - 1][1]:
-                    if self.db.remove_item_from_inventory("Normal Seed"):
-                        self.db.plant_seed(self.selected_plot, "Berry Bush")
-                        self.plots = [self.db.get_garden_plots()[i] for i in sorted(self.db.get_garden_plots().keys())]
+        for i, rect in enumerate(self.plot_rects):
+            if rect.collidepoint(click_pos):
+                self.selected_plot = i + 1
+                return
+        
+        if self.selected_plot:
+            if not self.plots[self.selected_plot - 1].plant_id:
+                if self.db.remove_item_from_inventory("Normal Seed"):
+                    self.db.plant_seed(self.selected_plot, "Berry Bush")
+                    self._refresh_plots()
 
-                else:
-                    self.db.water_plant(self.selected_plot)
-                    self.plots = [self.db.get_garden_plots()[i] for i in sorted(self.db.get_garden_plots().keys())]
-            
-            self.selected_plot = None
+            else:
+                self.db.water_plant(self.selected_plot)
+                self._refresh_plots()
+        
+        self.selected_plot = None
 
     def update(self):
-        for i, plot in enumerate(self.plots):
-            plot_id, plant_id, plant_time, last_watered_time = plot
-            if plant_id:
-                plant_info = self.db.get_plant(plant_id)
-                if plant_info:
-                    growth_time_seconds = plant_info[3]
-                    if time.time() - plant_time > growth_time_seconds:
-                        reward_item = plant_info[4]
-                        reward_quantity = plant_info[5]
-                        self.db.add_item_to_inventory(reward_item, reward_quantity)
-                        self.db.plant_seed(plot_id, None)
-                        self.plots = [self.db.get_garden_plots()[i] for i in sorted(self.db.get_garden_plots().keys())]
+        # Growth is measured in seconds, so checking once per second is plenty
+        now = time.time()
+        if now - self._last_update < 1.0:
+            return
+        self._last_update = now
+
+        ready_plots = [plot for plot in self.plots if now > plot.ready_time]
+        for plot in ready_plots:
+            plant_info = self._get_plant_info(plot.plant_id)
+            reward_item = plant_info[4]
+            reward_quantity = plant_info[5]
+            self.db.add_item_to_inventory(reward_item, reward_quantity)
+            self.db.plant_seed(plot.plot_id, None)
+        if ready_plots:
+            self._refresh_plots()
+        else:
+            self._update_growth(now)
 
     def draw(self, surface):
         surface.fill(COLOR_BG)
-        title_surf = self.font.render("Gardening", False, COLOR_TEXT)
+        title_surf = render_text(self.font, "Gardening")
         surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
 
         for i, rect in enumerate(self.plot_rects):
             pygame.draw.rect(surface, COLOR_UI_BAR_BG, rect, border_radius=10)
-            plot_id, plant_id, plant_time, last_watered_time = self.plots[i]
+            plot = self.plots[i]
             
-            if plant_id:
-                plant_info = self.db.get_plant(plant_id)
+            if plot.plant_id:
+                plant_info = self._get_plant_info(plot.plant_id)
                 if plant_info:
                     plant_name = plant_info[1]
-                    growth_time_seconds = plant_info[3]
-                    time_passed = time.time() - plant_time
-                    growth_percentage = min(1, time_passed / growth_time_seconds)
-                    
-                    plant_surf = self.font.render(plant_name, False, COLOR_TEXT)
+                    plant_surf = render_text(self.font, plant_name)
                     surface.blit(plant_surf, (rect.x + 10, rect.y + 10))
                     
                     bar_width = rect.width - 20
                     bar_height = 10
-                    fill_width = bar_width * growth_percentage
+                    fill_width = bar_width * plot.growth_pct
                     pygame.draw.rect(surface, (0, 255, 0), (rect.x + 10, rect.y + 40, fill_width, bar_height))
                     
-                    if time.time() - last_watered_time > 3600: # 1 hour
-                        water_surf = self.font.render("Needs water!", False, (255, 0, 0))
-                        surface.blit(water_surf, (rect.x + 10, rect.y + 60))
+                    if plot.needs_water:
+                        surface.blit(render_text(self.font, "Needs water!", (255, 0, 0)), (rect.x + 10, rect.y + 60))
 
             else:
-                plant_surf = self.font.render("Empty", False, COLOR_TEXT)
-                surface.blit(plant_surf, (rect.x + 10, rect.y + 10))
+                surface.blit(render_text(self.font, "Empty"), (rect.x + 10, rect.y + 10))
                 
         if self.selected_plot:
             rect = self.plot_rects[self.selected_plot - 1]
             pygame.draw.rect(surface, (255, 255, 0), rect, 2, border_radius=10)
             
-            if not self.plots[self.selected_plot - 1][1]:
-                option_surf = self.font.render("Plant Seed", False, COLOR_TEXT)
-                surface.blit(option_surf, (rect.x + 10, rect.y + 80))
+            if not self.plots[self.selected_plot - 1].plant_id:
+                surface.blit(render_text(self.font, "Plant Seed"), (rect.x + 10, rect.y + 80))
             else:
-                option_surf = self.font.render("Water Plant", False, COLOR_TEXT)
-                surface.blit(option_surf, (rect.x + 10, rect.y + 80))
+                surface.blit(render_text(self.font, "Water Plant"), (rect.x + 10, rect.y + 80))
         
         pygame.draw.rect(surface, COLOR_BTN, self.close_button, border_radius=5)
-        close_text = self.font.render("Close", False, COLOR_TEXT)
+        close_text = render_text(self.font, "Close")
         surface.blit(close_text, close_text.get_rect(center=self.close_button.center))
@@ -2,14 +2,30 @@ import os
 import sys
 import pygame
 from constants import *
-from models import GameState, PetState, PetStats
+from models import GameState, PetState
 from database import DatabaseManager
 from pet_entity import Pet
 from minigames import CatchTheFoodMinigame
 from gardening import GardeningGame
+from ui_helpers import render_text
 
 import time
 import datetime
+import functools
+
+
+@functools.lru_cache(maxsize=256)
+def render_bar_fill(color, width, height):
+    """Memoized rounded stat-bar fill; a bar only ever has ~80 distinct widths per color."""
+    fill = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(fill, color, (0, 0, width, height), border_radius=4)
+    return fill.convert_alpha()
+
+
+@functools.lru_cache(maxsize=1)
+def format_clock_minute(epoch_minute):
+    """HH:MM local time for a minute since the epoch; formatted once per minute, not per message."""
+    return time.strftime("%H:%M", time.localtime(epoch_minute * 60))
 
 
 class MessageBox:
@@ -17,6 +33,7 @@ class MessageBox:
         self.screen = screen
         self.font = font
         self.small_font = pygame.font.Font(None, small_font_size)
+        self.pop_up_font = pygame.font.Font(None, small_font_size // 2)
         
         self.maximized_height = height
         self.minimized_height = 30
@@ -32,6 +49,26 @@ class MessageBox:
         self.duration = duration # Initialize duration
         self.current_pop_up_message = "" # Initialize pop-up message
 
+        # The panel backgrounds never change, so build them once instead of every frame
+        self._minimized_panel = self._build_minimized_panel()
+        self._maximized_panel = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
+        self._maximized_panel.fill(COLOR_MESSAGE_BOX_BG)
+        self._maximized_panel = self._maximized_panel.convert_alpha()
+        self._log_surface = None
+        self._log_scroll_offset = 0
+        self._log_dirty = True
+
+    def _build_minimized_panel(self):
+        """Pre-renders the minimized bar (background + centered label) into one surface."""
+        panel = pygame.Surface((self.min_rect.width, self.min_rect.height), pygame.SRCALPHA)
+        panel.fill((50, 50, 50, 150)) # A bit of background
+        text_surf = self.small_font.render("Messages", False, COLOR_TEXT)
+        # Center the text
+        text_x = (self.min_rect.width - text_surf.get_width()) // 2
+        text_y = (self.min_rect.height - text_surf.get_height()) // 2
+        panel.blit(text_surf, (text_x, text_y))
+        return panel.convert_alpha()
+
     def _wrap_text(self, text, font, max_width):
         words = text.split(' ')
         lines = []
@@ -47,15 +84,26 @@ class MessageBox:
         return lines
 
     def add_message(self, text):
-        timestamp = datetime.datetime.now().strftime("%H:%M")
+        timestamp = format_clock_minute(int(time.time() // 60))
         full_message = f"[{timestamp}] {text}"
         self.messages.append(full_message)
         new_lines = self._wrap_text(full_message, self.font, self.rect.width - 2 * self.padding)
         self.all_lines.extend(new_lines)
+        self._log_dirty = True
         # When a new message is added, make it active and set the timer for pop-up
         self.active = True
         self.timer = self.duration
         self.current_pop_up_message = text # Store the message to be displayed as pop-up
+        self._pop_up_surface = self._build_pop_up(text)
+
+    def _build_pop_up(self, text):
+        """Bakes the pop-up backing and text into one surface, once per message."""
+        text_surf = self.pop_up_font.render(text, True, COLOR_TEXT)
+        bubble_rect = text_surf.get_rect().inflate(10, 5)
+        bubble = pygame.Surface(bubble_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(bubble, BLACK, bubble.get_rect(), border_radius=5)
+        bubble.blit(text_surf, text_surf.get_rect(center=bubble.get_rect().center))
+        return bubble.convert_alpha()
 
     def update(self, dt):
         if self.active:
@@ -67,15 +115,16 @@ class MessageBox:
     def toggle_state(self, clear_unread_callback):
         if self.state == 'minimized':
             self.state = 'maximized'
+            self._log_dirty = True
             self.scroll_offset = 0
             clear_unread_callback()
         elif self.state == 'maximized':
             self.state = 'minimized'
 
     def get_pop_up_info(self):
-        """Returns (message, is_active) for the temporary pop-up."""
+        """Returns (baked pop-up surface, is_active) for the temporary pop-up."""
         if self.current_pop_up_message and self.active and self.state == 'minimized':
-            return self.current_pop_up_message, True
+            return self._pop_up_surface, True
         return None, False
 
     def draw(self):
@@ -86,21 +135,18 @@ class MessageBox:
             self.draw_maximized()
 
     def draw_minimized(self):
-        s = pygame.Surface((self.min_rect.width, self.min_rect.height), pygame.SRCALPHA)
-        s.fill((50, 50, 50, 150)) # A bit of background
-        self.screen.blit(s, self.min_rect.topleft)
-
-        display_text = "Messages"
-        text_surf = self.small_font.render(display_text, False, COLOR_TEXT)
-        # Center the text
-        text_x = self.min_rect.x + (self.min_rect.width - text_surf.get_width()) // 2
-        text_y = self.min_rect.y + (self.min_rect.height - text_surf.get_height()) // 2
-        self.screen.blit(text_surf, (text_x, text_y))
+        self.screen.blit(self._minimized_panel, self.min_rect.topleft)
 
     def draw_maximized(self):
-        s = pygame.Surface((self.rect.width, self.rect.height), pygame.SRCALPHA)
-        s.fill(COLOR_MESSAGE_BOX_BG)
-        self.screen.blit(s, (self.rect.x, self.rect.y))
+        if self._log_dirty or self._log_scroll_offset != self.scroll_offset:
+            self._log_surface = self._build_log_surface()
+            self._log_scroll_offset = self.scroll_offset
+            self._log_dirty = False
+        self.screen.blit(self._log_surface, (self.rect.x, self.rect.y))
+
+    def _build_log_surface(self):
+        """Composes the backdrop and visible message lines; only rebuilt when the log changes."""
+        log_surface = self._maximized_panel.copy()
         y_offset = self.padding
         start_index = len(self.all_lines) - 1 - self.scroll_offset
         for i in range(start_index, -1, -1):
@@ -109,10 +155,17 @@ class MessageBox:
             line_height = text_surface.get_height()
             if self.rect.height - y_offset - line_height < 0:
                 break
-            self.screen.blit(text_surface, (self.rect.x + self.padding, self.rect.y + self.rect.height - y_offset - line_height))
+            log_surface.blit(text_surface, (self.padding, self.rect.height - y_offset - line_height))
             y_offset += line_height + self.padding
+        return log_surface
+
 
 
+class _SilentSound:
+    """Stand-in for a sound that could not be loaded."""
+    def play(self):
+        pass
+
 
 # --- Day/Night Cycle Colors ---
 COLOR_DAY_BG = (135, 206, 235)  # Sky Blue
@@ -120,6 +173,18 @@ COLOR_DUSK_BG = (255, 165, 0)   # Orange
 COLOR_NIGHT_BG = (25, 25, 112)  # Midnight Blue
 COLOR_DAWN_BG = (255, 223, 186) # Peach Puff
 
+# Stats whose increase makes their bar flash (see GameEngine.get_flash_stat_values)
+FLASH_STATS = ('happiness', 'fullness', 'discipline', 'energy', 'health')
+
+# Sky color for each hour of the day, indexed by hour (0-23)
+BG_COLOR_BY_HOUR = tuple(
+    COLOR_DAY_BG if 6 <= hour < 18
+    else COLOR_DUSK_BG if 18 <= hour < 22
+    else COLOR_DAWN_BG if 5 <= hour < 6
+    else COLOR_NIGHT_BG
+    for hour in range(24)
+)
+
 
 class GameEngine:
     """Orchestrates the MVC relationship."""
@@ -141,16 +206,17 @@ class GameEngine:
         pygame.init()
         pygame.mixer.init()
 
-        # The native resolution of the game
-        self.native_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        # The window screen, which will be scaled
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH * 2, SCREEN_HEIGHT * 2), pygame.RESIZABLE)
+        # The window is opened at the native resolution and SDL scales it up to the window size,
+        # so the game draws straight into the display surface and needs no software rescale
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.RESIZABLE)
+        self.native_surface = self.screen
         
         # Load background image
         base_path = os.path.dirname(__file__)
         background_path = os.path.join(base_path, "assets", "backgrounds", "background.png")
         self.background_image = pygame.image.load(background_path).convert_alpha()
         self.background_image = pygame.transform.scale(self.background_image, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._composited_backgrounds = {}
         
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 16)
@@ -162,28 +228,31 @@ class GameEngine:
         # Initial message will now be handled by the Pet's loading/initialization
         # self.message_box.add_message("Welcome!")
         
+        Pet.preload_assets()
         self.pet = Pet(self.db, name="Bobo", message_callback=self.add_game_message)
         self.pet.load()
 
         self.stat_flash_timers = {}
-        self.prev_stats = PetStats()
-        self.update_prev_stats()
+        self._bar_backgrounds = {}
+        self.prev_stat_values = self.get_flash_stat_values()
         self.game_time = datetime.datetime.now()
         self.game_state = GameState.PET_VIEW
 
         # --- Load Sounds and Music ---
         base_path = os.path.dirname(__file__)
-        try:
-            self.sound_click = pygame.mixer.Sound(os.path.join(base_path, "assets", "audio", "click.wav"))
-            self.sound_eat = pygame.mixer.Sound(os.path.join(base_path, "assets", "audio", "eat.wav"))
-            self.sound_play = pygame.mixer.Sound(os.path.join(base_path, "assets", "audio", "play.wav"))
-            self.sound_heal = pygame.mixer.Sound(os.path.join(base_path, "assets", "audio", "heal.wav"))
-        except pygame.error as e:
-            print(f"Warning: Could not load sound files. Game will be silent. Error: {e}")
-            self.sound_click, self.sound_eat, self.sound_play, self.sound_heal = None, None, None, None
+        # Sounds that fail to load are replaced by a silent stand-in, so callers can always play()
+        self.sounds = {}
+        for name in ("click", "eat", "play", "heal"):
+            try:
+                self.sounds[name] = pygame.mixer.Sound(os.path.join(base_path, "assets", "audio", f"{name}.wav"))
+            except pygame.error as e:
+                print(f"Warning: Could not load sound '{name}'. It will be silent. Error: {e}")
+                self.sounds[name] = _SilentSound()
 
 
         self.pet_center_x, self.pet_center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT - 80 # Adjusted Y position to move pet lower
+        # Last known pointer position in native coordinates; only motion events move it
+        self.pointer_pos = (self.pet_center_x, SCREEN_HEIGHT - 50)
         self.pet_click_area = pygame.Rect(self.pet_center_x - 40, self.pet_center_y - 40, 80, 80)
 
         # UI Hitboxes - Buttons are now half as tall (20 pixels) and positioned lower, and adjusted width for new button
@@ -202,7 +271,17 @@ class GameEngine:
             (self.btn_shop, "SHOP", self.handle_shop),
             (self.btn_quit, "QUIT", lambda: sys.exit()),
         ]
+        # Button labels never change: render them once and blit them all in one call
+        self._button_label_blits = []
+        for rect, text, _ in self.buttons:
+            text_surf = render_text(self.font, text)
+            self._button_label_blits.append((text_surf, text_surf.get_rect(center=rect.center)))
         self.inventory_buttons, self.shop_buttons, self.activities_buttons = [], [], []
+        # Rects of each menu's buttons, kept in button order for collidelist hit-testing
+        self._inventory_rects, self._shop_rects, self._activities_rects = [], [], []
+        # Menu screens are baked into surfaces and rebuilt only when their contents change
+        self._inventory_panel, self._shop_panel, self._activities_panel = None, None, None
+        self._inventory_panel_rows = None # Inventory rows the inventory panel was baked from
         self.minigame = None
 
 
@@ -213,11 +292,15 @@ class GameEngine:
 
 
     def handle_feed(self):
-        print(f"handle_feed called. Current pet state: {self.pet.state}")
+        if DEBUG:
+            print(f"handle_feed called. Current pet state: {self.pet.state.name}")
         if self.pet.state == PetState.IDLE:
+            if self.db.get_inventory() != self._inventory_panel_rows:
+                self._inventory_panel = None # Inventory changed since the panel was baked
             self.game_state = GameState.INVENTORY_VIEW
 
     def handle_shop(self):
+                    self._shop_panel = None # Coins may have changed since it was last shown
                     self.game_state = GameState.SHOP_VIEW
 
     def handle_activities(self):
@@ -226,30 +309,55 @@ class GameEngine:
 
     def handle_train(self):
         if self.pet.state == PetState.IDLE or self.pet.state == PetState.SICK:
-            if self.sound_click: self.sound_click.play()
+            self.sounds["click"].play()
             self.pet.transition_to(PetState.TRAINING)
     
     def handle_heal(self):
         if self.pet.state == PetState.SICK:
-            if self.sound_heal: self.sound_heal.play()
+            self.sounds["heal"].play()
             self.pet.heal()
 
     def _toggle_sleep(self):
-        if self.sound_click: self.sound_click.play()
+        self.sounds["click"].play()
         if self.pet.state == PetState.SLEEPING:
             self.pet.transition_to(PetState.IDLE)
         else:
             self.pet.transition_to(PetState.SLEEPING)
 
-    def update_prev_stats(self):
-        self.prev_stats.fullness = self.pet.stats.fullness
-        self.prev_stats.happiness = self.pet.stats.happiness
-        self.prev_stats.energy = self.pet.stats.energy
-        self.prev_stats.health = self.pet.stats.health
-        self.prev_stats.discipline = self.pet.stats.discipline
-
-    def draw_bar(self, x, y, value, color, label):
-        """Draws a progress bar with value text inside the bar."""
+    def get_background(self, sky_color):
+        """
+        Returns the background image pre-composited over the given sky color.
+        The result is fully opaque, so it is stored with convert() and blitted
+        without per-pixel alpha blending. One surface is cached per sky color.
+        """
+        background = self._composited_backgrounds.get(sky_color)
+        if background is None:
+            background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            background.fill(sky_color)
+            background.blit(self.background_image, (0, 0))
+            background = background.convert()
+            self._composited_backgrounds[sky_color] = background
+        return background
+
+    def get_flash_stat_values(self):
+        """Snapshot of the stats watched for bar flashing, in FLASH_STATS order."""
+        stats = self.pet.stats
+        return (stats.happiness, stats.fullness, stats.discipline, stats.energy, stats.health)
+
+    def _get_bar_background(self, label, bar_width, bar_height):
+        """Returns the label and empty bar track for a stat bar, pre-drawn on one surface."""
+        background = self._bar_backgrounds.get(label)
+        if background is None:
+            label_surf = render_text(self.font, label)
+            background = pygame.Surface((max(bar_width, label_surf.get_width()), 18 + bar_height), pygame.SRCALPHA)
+            background.blit(label_surf, (0, 0))
+            pygame.draw.rect(background, COLOR_UI_BAR_BG, (0, 18, bar_width, bar_height), border_radius=4)
+            background = background.convert_alpha()
+            self._bar_backgrounds[label] = background
+        return background
+
+    def bar_blits(self, x, y, value, color, label):
+        """Returns the (surface, position) pairs that draw a progress bar with value text inside the bar."""
         bar_width, bar_height = 80, 16 
         
         bar_color = color
@@ -258,256 +366,307 @@ class GameEngine:
             if int(self.stat_flash_timers[stat_key] * 10) % 2 == 0:
                 bar_color = (255, 255, 255)
 
-        # Label Text
-        self.native_surface.blit(self.font.render(label, False, COLOR_TEXT), (x, y - 18))
-        
-        # Bar Background
-        pygame.draw.rect(self.native_surface, COLOR_UI_BAR_BG, (x, y, bar_width, bar_height), border_radius=4)
+        # Label Text + Bar Background (static, baked once per bar)
+        background = self._get_bar_background(label, bar_width, bar_height)
         
         # Bar Fill
-        fill_width = (value / 100.0) * bar_width
-        pygame.draw.rect(self.native_surface, bar_color, (x, y, fill_width, bar_height), border_radius=4)
+        fill_width = int((value / 100.0) * bar_width)
+        fill = render_bar_fill(bar_color, fill_width, bar_height)
         
         # Percentage Text Overlay (inside the bar)
-        val_txt = self.font.render(f"{int(value)}%", False, COLOR_TEXT)
-        self.native_surface.blit(val_txt, (x + bar_width // 2 - val_txt.get_width() // 2, y + bar_height // 2 - val_txt.get_height() // 2))
-
-    def draw_inventory(self):
-        self.native_surface.fill(COLOR_BG)
-        title_surf = self.font.render("Inventory", False, COLOR_TEXT)
-        self.native_surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
-
-        self.inventory_buttons.clear()
+        val_txt = render_text(self.font, f"{int(value)}%")
+        return (
+            (background, (x, y - 18)),
+            (fill, (x, y)),
+            (val_txt, (x + bar_width // 2 - val_txt.get_width() // 2, y + bar_height // 2 - val_txt.get_height() // 2)),
+        )
+
+    def _create_inventory_buttons(self):
+        """Builds the inventory buttons and bakes the whole inventory screen into one surface."""
+        panel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        panel.fill(COLOR_BG)
+        title_surf = render_text(self.font, "Inventory")
+        panel.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
+
+        self.inventory_buttons = []
 
         # Add Snack button
         snack_rect = pygame.Rect(50, 60, SCREEN_WIDTH - 100, 20) # Half height
         self.inventory_buttons.append((snack_rect, "Snack"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, snack_rect, border_radius=5)
-        self.native_surface.blit(self.font.render("Snack (Free)", False, COLOR_TEXT), (snack_rect.x + 10, snack_rect.y + 2)) # Adjusted text y to center
+        pygame.draw.rect(panel, COLOR_BTN, snack_rect, border_radius=5)
+        panel.blit(render_text(self.font, "Snack (Free)"), (snack_rect.x + 10, snack_rect.y + 2)) # Adjusted text y to center
 
         inventory_items = self.db.get_inventory()
+        self._inventory_panel_rows = inventory_items
         start_y = 90 # Adjusted start_y for next button, previous was 110. (60 + 20 + 10 padding = 90)
 
         if not inventory_items:
-            empty_msg = self.font.render("Your inventory is empty! Buy items from the shop.", False, COLOR_TEXT)
-            self.native_surface.blit(empty_msg, empty_msg.get_rect(center=(SCREEN_WIDTH // 2, start_y + 30))) # Adjusted y for message
+            empty_msg = render_text(self.font, "Your inventory is empty! Buy items from the shop.")
+            panel.blit(empty_msg, empty_msg.get_rect(center=(SCREEN_WIDTH // 2, start_y + 30))) # Adjusted y for message
         
         for i, item in enumerate(inventory_items):
             item_name, quantity, _, _, _ = item
             item_text = f"{item_name} (x{quantity})"
             item_rect = pygame.Rect(50, start_y + i * 25, SCREEN_WIDTH - 100, 20) # Half height, proportional spacing
             self.inventory_buttons.append((item_rect, item_name))
-            pygame.draw.rect(self.native_surface, COLOR_BTN, item_rect, border_radius=5)
-            self.native_surface.blit(self.font.render(item_text, False, COLOR_TEXT), (item_rect.x + 10, item_rect.y + 2)) # Adjusted text y to center
+            pygame.draw.rect(panel, COLOR_BTN, item_rect, border_radius=5)
+            panel.blit(render_text(self.font, item_text), (item_rect.x + 10, item_rect.y + 2)) # Adjusted text y to center
 
-        close_button = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 40, 100, 20) # Half height, adjusted y
-        self.inventory_buttons.append((close_button, "CLOSE"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, close_button, border_radius=5)
-        self.native_surface.blit(self.font.render("Close", False, COLOR_TEXT), (close_button.centerx - self.font.render("Close", False, COLOR_TEXT).get_width() // 2, close_button.y + 2)) # Adjusted text y to center
-    
-    def draw_activities(self):
-        self.native_surface.fill(COLOR_BG)
-        title_surf = self.font.render("Activities", False, COLOR_TEXT)
-        self.native_surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
+        self._draw_close_button(panel, self.inventory_buttons)
+        self._inventory_rects = [rect for rect, _ in self.inventory_buttons]
+        self._inventory_panel = panel
+
+    def _create_activities_buttons(self):
+        """Builds the activities buttons and bakes the activities screen; its contents never change."""
+        panel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        panel.fill(COLOR_BG)
+        title_surf = render_text(self.font, "Activities")
+        panel.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
 
-        self.activities_buttons.clear()
+        self.activities_buttons = []
         
         bouncing_pet_button = pygame.Rect(50, 60, SCREEN_WIDTH - 100, 20) # Half height
         self.activities_buttons.append((bouncing_pet_button, "Catch the Food"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, bouncing_pet_button, border_radius=5)
-        self.native_surface.blit(self.font.render("Catch the Food", False, COLOR_TEXT), (bouncing_pet_button.x + 10, bouncing_pet_button.y + 2)) # Adjusted text y to center
+        pygame.draw.rect(panel, COLOR_BTN, bouncing_pet_button, border_radius=5)
+        panel.blit(render_text(self.font, "Catch the Food"), (bouncing_pet_button.x + 10, bouncing_pet_button.y + 2)) # Adjusted text y to center
 
         gardening_button = pygame.Rect(50, 85, SCREEN_WIDTH - 100, 20) # Half height, adjusted y
         self.activities_buttons.append((gardening_button, "Gardening"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, gardening_button, border_radius=5)
-        self.native_surface.blit(self.font.render("Gardening (WIP)", False, COLOR_TEXT), (gardening_button.x + 10, gardening_button.y + 2)) # Adjusted text y to center
+        pygame.draw.rect(panel, COLOR_BTN, gardening_button, border_radius=5)
+        panel.blit(render_text(self.font, "Gardening (WIP)"), (gardening_button.x + 10, gardening_button.y + 2)) # Adjusted text y to center
         
-        close_button = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 40, 100, 20) # Half height, adjusted y
-        self.activities_buttons.append((close_button, "CLOSE"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, close_button, border_radius=5)
-        self.native_surface.blit(self.font.render("Close", False, COLOR_TEXT), (close_button.centerx - self.font.render("Close", False, COLOR_TEXT).get_width() // 2, close_button.y + 2)) # Adjusted text y to center
-
-    def draw_shop(self):
-        self.native_surface.fill(COLOR_BG)
-        title_surf = self.font.render("Shop", False, COLOR_TEXT)
-        self.native_surface.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
-        points_surf = self.font.render(f"Coins: {self.pet.stats.coins}", False, COLOR_TEXT)
-        self.native_surface.blit(points_surf, (20, 20))
-
-        self.shop_buttons.clear()
+        self._draw_close_button(panel, self.activities_buttons)
+        self._activities_rects = [rect for rect, _ in self.activities_buttons]
+        self._activities_panel = panel
+
+    def _create_shop_buttons(self):
+        """Builds the shop buttons and bakes the shop screen, including the current coin count."""
+        panel = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        panel.fill(COLOR_BG)
+        title_surf = render_text(self.font, "Shop")
+        panel.blit(title_surf, (SCREEN_WIDTH // 2 - title_surf.get_width() // 2, 20))
+        points_surf = render_text(self.font, f"Coins: {self.pet.stats.coins}")
+        panel.blit(points_surf, (20, 20))
+
+        self.shop_buttons = []
         for i, (item_name, price) in enumerate(SHOP_ITEMS.items()):
             item_text = f"Buy {item_name} - {price} pts"
             item_rect = pygame.Rect(50, 60 + i * 25, SCREEN_WIDTH - 100, 20) # Half height, proportional spacing
             self.shop_buttons.append((item_rect, item_name))
-            pygame.draw.rect(self.native_surface, COLOR_BTN, item_rect, border_radius=5)
-            self.native_surface.blit(self.font.render(item_text, False, COLOR_TEXT), (item_rect.x + 10, item_rect.y + 2)) # Adjusted text y to center
+            pygame.draw.rect(panel, COLOR_BTN, item_rect, border_radius=5)
+            panel.blit(render_text(self.font, item_text), (item_rect.x + 10, item_rect.y + 2)) # Adjusted text y to center
+
+        self._draw_close_button(panel, self.shop_buttons)
+        self._shop_rects = [rect for rect, _ in self.shop_buttons]
+        self._shop_panel = panel
 
+    def _draw_close_button(self, panel, buttons):
         close_button = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT - 40, 100, 20) # Half height, adjusted y
-        self.shop_buttons.append((close_button, "CLOSE"))
-        pygame.draw.rect(self.native_surface, COLOR_BTN, close_button, border_radius=5)
-        self.native_surface.blit(self.font.render("Close", False, COLOR_TEXT), (close_button.centerx - self.font.render("Close", False, COLOR_TEXT).get_width() // 2, close_button.y + 2)) # Adjusted text y to center
+        buttons.append((close_button, "CLOSE"))
+        pygame.draw.rect(panel, COLOR_BTN, close_button, border_radius=5)
+        close_text = render_text(self.font, "Close")
+        panel.blit(close_text, (close_button.centerx - close_text.get_width() // 2, close_button.y + 2)) # Adjusted text y to center
+
+    def draw_inventory(self):
+        if self._inventory_panel is None:
+            self._create_inventory_buttons()
+        self.native_surface.blit(self._inventory_panel, (0, 0))
+    
+    def draw_activities(self):
+        if self._activities_panel is None:
+            self._create_activities_buttons()
+        self.native_surface.blit(self._activities_panel, (0, 0))
+
+    def draw_shop(self):
+        if self._shop_panel is None:
+            self._create_shop_buttons()
+        self.native_surface.blit(self._shop_panel, (0, 0))
+
+    def _clicked_button(self, buttons, rects, click_pos):
+        """Returns the name of the menu button under click_pos, or None. Menu buttons never overlap."""
+        index = pygame.Rect(click_pos, (1, 1)).collidelist(rects)
+        return buttons[index][1] if index != -1 else None
 
     def handle_inventory_clicks(self, click_pos):
-        for rect, name in self.inventory_buttons:
-            if rect.collidepoint(click_pos):
-                if name == "CLOSE":
-                    self.game_state = GameState.PET_VIEW
-                elif name == "Snack":
-                    item = self.db.get_item("Snack") # Get snack details from db
-
-                    if item:
-                        _, _, _, effect_stat, effect_value = item
-                        current_value = getattr(self.pet.stats, effect_stat)
-                        setattr(self.pet.stats, effect_stat, self.pet.stats.clamp(current_value + effect_value))
-                        self.add_game_message({"text": f"You fed {self.pet.name} a snack.", "notify": False})
-                        self.game_state = GameState.PET_VIEW
-                        if self.sound_eat: self.sound_eat.play()
+        name = self._clicked_button(self.inventory_buttons, self._inventory_rects, click_pos)
+        if name == "CLOSE":
+            self.game_state = GameState.PET_VIEW
+        elif name == "Snack":
+            item = self.db.get_item("Snack") # Get snack details from db
+
+            if item:
+                _, _, _, effect_stat, effect_value = item
+                current_value = getattr(self.pet.stats, effect_stat)
+                setattr(self.pet.stats, effect_stat, self.pet.stats.clamp(current_value + effect_value))
+                self.add_game_message({"text": f"You fed {self.pet.name} a snack.", "notify": False})
+                self.game_state = GameState.PET_VIEW
+                self.sounds["eat"].play()
 
 
     def handle_activities_clicks(self, click_pos):
-        for rect, name in self.activities_buttons:
-            if rect.collidepoint(click_pos):
-                if name == "CLOSE":
-                    self.game_state = GameState.PET_VIEW
-                elif name == "Catch the Food":
-                    self.minigame = CatchTheFoodMinigame(self.font)
-                    self.game_state = GameState.CATCH_THE_FOOD_MINIGAME
-                elif name == "Gardening":
-                    self.minigame = GardeningGame(self.font, self.db)
-                    self.game_state = GameState.GARDENING_MINIGAME
+        name = self._clicked_button(self.activities_buttons, self._activities_rects, click_pos)
+        if name == "CLOSE":
+            self.game_state = GameState.PET_VIEW
+        elif name == "Catch the Food":
+            self.minigame = CatchTheFoodMinigame(self.font)
+            self.game_state = GameState.CATCH_THE_FOOD_MINIGAME
+        elif name == "Gardening":
+            self.minigame = GardeningGame(self.font, self.db)
+            self.game_state = GameState.GARDENING_MINIGAME
 
     def handle_shop_clicks(self, click_pos):
-        for rect, name in self.shop_buttons:
-            if rect.collidepoint(click_pos):
-                if name == "CLOSE":
-                    self.game_state = GameState.PET_VIEW
-                else:
-                    price = SHOP_ITEMS.get(name)
-                    if price and self.pet.stats.coins >= price:
-                        self.pet.stats.coins -= price
-                        self.db.add_item_to_inventory(name)
-                        self.add_game_message({"text": f"You bought a {name}!", "notify": False})
-                    else:
-                        self.add_game_message({"text": "Not enough coins!", "notify": True})
+        name = self._clicked_button(self.shop_buttons, self._shop_rects, click_pos)
+        if name == "CLOSE":
+            self.game_state = GameState.PET_VIEW
+        elif name is not None:
+            price = SHOP_ITEMS.get(name)
+            if price and self.pet.stats.coins >= price:
+                self.pet.stats.coins -= price
+                self.db.add_item_to_inventory(name)
+                self._shop_panel = None
+                self.add_game_message({"text": f"You bought a {name}!", "notify": False})
+            else:
+                self.add_game_message({"text": "Not enough coins!", "notify": True})
 
     def run(self):
+        # Bind the lookups made every frame to locals once; the loop is interpreter-bound on a Pi
+        event_get, tick = pygame.event.get, self.clock.tick
+        surface, message_box, pet = self.native_surface, self.message_box, self.pet
+        QUIT, MOUSEWHEEL, MOUSEMOTION = pygame.QUIT, pygame.MOUSEWHEEL, pygame.MOUSEMOTION
+        MOUSEBUTTONDOWN, FINGERDOWN, FINGERMOTION = pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN, pygame.FINGERMOTION
+        PET_VIEW = GameState.PET_VIEW
+        CATCH_THE_FOOD, GARDENING = GameState.CATCH_THE_FOOD_MINIGAME, GameState.GARDENING_MINIGAME
+
+        last_frame_key = None # (game_state, pop-up) of the last menu frame that was presented
+        minigame_accumulator = 0.0 # Frame time not yet consumed by fixed minigame steps
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            self.message_box.update(dt)
+            dt = tick(FPS) / 1000.0
+            message_box.update(dt)
             
             self.game_time += datetime.timedelta(seconds=dt * TIME_SCALE_FACTOR)
             current_hour = self.game_time.hour
             
-            if 6 <= current_hour < 18: current_bg_color = COLOR_DAY_BG
-            elif 18 <= current_hour < 22: current_bg_color = COLOR_DUSK_BG
-            elif 5 <= current_hour < 6: current_bg_color =COLOR_DAWN_BG
-            else: current_bg_color = COLOR_NIGHT_BG            
+            current_bg_color = BG_COLOR_BY_HOUR[current_hour]
             click_pos = None
-            current_pointer_pos = (self.pet_center_x, SCREEN_HEIGHT - 50) # Initialize with a reasonable default
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: running = False
+            had_events = False
+            for event in event_get():
+                # Motion only moves the pointer, and only its last position this frame matters,
+                # so it skips the rest of dispatch and does not count as input that needs a redraw.
+                # SCALED mode already reports mouse positions in native coordinates
+                if event.type == MOUSEMOTION:
+                    self.pointer_pos = event.pos
+                    continue
+                if event.type == FINGERMOTION:
+                    self.pointer_pos = (int(event.x * SCREEN_WIDTH), int(event.y * SCREEN_HEIGHT))
+                    continue
+
+                had_events = True
+                if event.type == QUIT: running = False
                 
-                if event.type == pygame.MOUSEWHEEL:
-                    if self.message_box.state == 'maximized':
-                        self.message_box.handle_scroll(event)
-
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    scale_x = self.screen.get_width() / self.native_surface.get_width()
-                    scale_y = self.screen.get_height() / self.native_surface.get_height()
-                    click_pos = (event.pos[0] / scale_x, event.pos[1] / scale_y)
-                elif event.type == pygame.MOUSEMOTION:
-                    scale_x = self.screen.get_width() / self.native_surface.get_width()
-                    scale_y = self.screen.get_height() / self.native_surface.get_height()
-                    current_pointer_pos = (event.pos[0] / scale_x, event.pos[1] / scale_y)
-                elif event.type == pygame.FINGERDOWN:
-                    win_w, win_h = self.native_surface.get_size()
-                    click_pos = (int(event.x * win_w), int(event.y * win_h))
-                elif event.type == pygame.FINGERMOTION:
-                    win_w, win_h = self.native_surface.get_size()
-                    current_pointer_pos = (int(event.x * win_w), int(event.y * win_h))
+                if event.type == MOUSEWHEEL:
+                    if message_box.state == 'maximized':
+                        message_box.handle_scroll(event)
+
+                if event.type == MOUSEBUTTONDOWN and event.button == 1:
+                    click_pos = event.pos
+                elif event.type == FINGERDOWN:
+                    click_pos = (int(event.x * SCREEN_WIDTH), int(event.y * SCREEN_HEIGHT))
                 
-                if self.game_state == GameState.CATCH_THE_FOOD_MINIGAME and click_pos:
+                if self.game_state == CATCH_THE_FOOD and click_pos:
                     self.minigame.handle_event(event, click_pos)
-                elif self.game_state == GameState.GARDENING_MINIGAME and click_pos:
+                elif self.game_state == GARDENING and click_pos:
                     self.minigame.handle_event(event, click_pos)
 
-            if self.game_state == GameState.CATCH_THE_FOOD_MINIGAME:
-                self.minigame.update(current_pointer_pos)
-                self.minigame.draw(self.native_surface)
+            if self.game_state == CATCH_THE_FOOD:
+                # Step at a fixed rate so food fall speed and spawning do not depend on frame timing
+                minigame_accumulator += dt
+                steps = min(int(minigame_accumulator / FIXED_DT), MAX_STEPS_PER_FRAME)
+                minigame_accumulator = min(minigame_accumulator - steps * FIXED_DT, FIXED_DT)
+                for _ in range(steps):
+                    self.minigame.update(self.pointer_pos, FIXED_DT)
+                self.minigame.draw(surface)
                 if self.minigame.game_over_acknowledged:
                     score = self.minigame.score
                     # Process score and rewards from Catch the Food
-                    self.pet.stats.happiness = self.pet.stats.clamp(self.pet.stats.happiness + score // 2) # Example reward
+                    pet.stats.happiness = pet.stats.clamp(pet.stats.happiness + score // 2) # Example reward
                     coins_earned = score // 5
-                    self.pet.stats.coins += coins_earned
+                    pet.stats.coins += coins_earned
                     self.add_game_message({"text": f"You earned {coins_earned} coins from Catch the Food! Score: {score}", "notify": False})
-                    self.game_state = GameState.PET_VIEW
+                    self.game_state = PET_VIEW
                     self.minigame = None
-            elif self.game_state == GameState.GARDENING_MINIGAME:
+            elif self.game_state == GARDENING:
                 self.minigame.update()
                 if self.minigame.is_over:
-                    self.game_state = GameState.PET_VIEW
+                    self.game_state = PET_VIEW
                     self.minigame = None
                 else:
-                    self.minigame.draw(self.native_surface)
+                    self.minigame.draw(surface)
             else:
                 if click_pos:
-                    if self.game_state == GameState.PET_VIEW:
-                        is_maximized_box_click = self.message_box.state == 'maximized' and self.message_box.rect.collidepoint(click_pos)
-                        is_minimized_box_click = self.message_box.state == 'minimized' and self.message_box.min_rect.collidepoint(click_pos)
+                    if self.game_state == PET_VIEW:
+                        is_maximized_box_click = message_box.state == 'maximized' and message_box.rect.collidepoint(click_pos)
+                        is_minimized_box_click = message_box.state == 'minimized' and message_box.min_rect.collidepoint(click_pos)
 
                         if is_maximized_box_click or is_minimized_box_click:
-                            self.message_box.toggle_state(lambda: setattr(self, 'unread_messages_count', 0))
-                            if self.sound_click: self.sound_click.play()
+                            message_box.toggle_state(lambda: setattr(self, 'unread_messages_count', 0))
+                            self.sounds["click"].play()
                         
-                        elif self.pet.state != PetState.DEAD:
-                            if self.sound_click:
-                                if any(rect.collidepoint(click_pos) for rect, _, _ in self.buttons):
-                                    self.sound_click.play()
-                            if self.pet.state == PetState.SICK and self.pet_click_area.collidepoint(click_pos): self.handle_heal()
+                        elif pet.state != PetState.DEAD:
+                            if any(rect.collidepoint(click_pos) for rect, _, _ in self.buttons):
+                                self.sounds["click"].play()
+                            if pet.state == PetState.SICK and self.pet_click_area.collidepoint(click_pos): self.handle_heal()
                             for rect, name, action in self.buttons:
                                 if rect.collidepoint(click_pos): action()
                     elif self.game_state == GameState.INVENTORY_VIEW: self.handle_inventory_clicks(click_pos)
                     elif self.game_state == GameState.SHOP_VIEW: self.handle_shop_clicks(click_pos)
                     elif self.game_state == GameState.ACTIVITIES_VIEW: self.handle_activities_clicks(click_pos)
             
-                if self.game_state == GameState.PET_VIEW:
-                    self.pet.update(dt, current_hour)
+                if self.game_state == PET_VIEW:
+                    pet.update(dt, current_hour)
                     
-                    for stat in ['happiness', 'fullness', 'discipline', 'energy', 'health']:
-                        if getattr(self.pet.stats, stat) > getattr(self.prev_stats, stat):
-                            self.stat_flash_timers[stat[:5]] = 1.5
-                    for key in list(self.stat_flash_timers.keys()):
-                        self.stat_flash_timers[key] -= dt
-                        if self.stat_flash_timers[key] <= 0: del self.stat_flash_timers[key]
-                    self.update_prev_stats()
-
-                if self.game_state == GameState.PET_VIEW:
-                    self.native_surface.fill(current_bg_color)
-                    self.native_surface.blit(self.background_image, (0, 0))
+                    stat_values = self.get_flash_stat_values()
+                    if stat_values != self.prev_stat_values:
+                        for stat, value, prev_value in zip(FLASH_STATS, stat_values, self.prev_stat_values):
+                            if value > prev_value:
+                                self.stat_flash_timers[stat[:5]] = 1.5
+                    if self.stat_flash_timers:
+                        self.stat_flash_timers = {key: t - dt for key, t in self.stat_flash_timers.items() if t > dt}
+                    self.prev_stat_values = stat_values
+
+                # Menu screens only change in response to input or when the pop-up changes,
+                # so keep the frame already on screen instead of redrawing and flipping it
+                frame_key = (self.game_state, message_box.get_pop_up_info()[0])
+                if self.game_state != PET_VIEW and not had_events and frame_key == last_frame_key:
+                    continue
+                last_frame_key = frame_key
+
+                if self.game_state == PET_VIEW:
+                    surface.blit(self.get_background(current_bg_color), (0, 0))
                 else:
-                    self.native_surface.fill(current_bg_color)
+                    surface.fill(current_bg_color)
 
-                if self.game_state == GameState.PET_VIEW:
+                if self.game_state == PET_VIEW:
                         cx, cy = self.pet_center_x, self.pet_center_y
-                        self.pet.draw(self.native_surface, cx, cy, self.font)
+                        pet.draw(surface, cx, cy, self.font)
                         
-                        self.draw_bar(20, 30, self.pet.stats.happiness, (255, 200, 0), "Happiness")
-                        self.draw_bar(110, 30, self.pet.stats.fullness, (0, 255, 0), "Fullness")
-                        self.draw_bar(200, 30, self.pet.stats.energy, (0, 0, 255), "Energy")
-                        self.draw_bar(290, 30, self.pet.stats.health, (255, 0, 0), "Health")
-                        self.draw_bar(380, 30, self.pet.stats.discipline, (255, 0, 255), "Discipline")
+                        # All five stat bars go out in a single batched blit
+                        surface.blits((
+                            *self.bar_blits(20, 30, pet.stats.happiness, (255, 200, 0), "Happiness"),
+                            *self.bar_blits(110, 30, pet.stats.fullness, (0, 255, 0), "Fullness"),
+                            *self.bar_blits(200, 30, pet.stats.energy, (0, 0, 255), "Energy"),
+                            *self.bar_blits(290, 30, pet.stats.health, (255, 0, 0), "Health"),
+                            *self.bar_blits(380, 30, pet.stats.discipline, (255, 0, 255), "Discipline"),
+                        ), doreturn=False)
                         
-                        self.message_box.draw()
+                        message_box.draw()
                         
-                        points_surf = self.font.render(f"Coins: {self.pet.stats.coins}", False, COLOR_TEXT)
-                        self.native_surface.blit(points_surf, (20, 60))
+                        points_surf = render_text(self.font, f"Coins: {pet.stats.coins}")
+                        surface.blit(points_surf, (20, 60))
                         
-                        for rect, text, _ in self.buttons:
-                            pygame.draw.rect(self.native_surface, COLOR_BTN, rect, border_radius=5)
-                            text_surf = self.font.render(text, False, COLOR_TEXT)
-                            self.native_surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+                        for rect, _, _ in self.buttons:
+                            pygame.draw.rect(surface, COLOR_BTN, rect, border_radius=5)
+                        surface.blits(self._button_label_blits, doreturn=False)
 
                 elif self.game_state == GameState.INVENTORY_VIEW:
                         self.draw_inventory()
@@ -516,17 +675,11 @@ class GameEngine:
                 elif self.game_state == GameState.ACTIVITIES_VIEW:
                         self.draw_activities()
                 
-            scaled_surface = pygame.transform.smoothscale(self.native_surface, self.screen.get_size())
-            self.screen.blit(scaled_surface, (0, 0))
-
             # Draw pop-up message last to ensure it's on top
-            pop_up_message, is_pop_up_active = self.message_box.get_pop_up_info()
+            pop_up_surf, is_pop_up_active = message_box.get_pop_up_info()
             if is_pop_up_active:
-                pop_up_surf = self.message_box.small_font.render(pop_up_message, True, COLOR_TEXT)
-                # Position pop-up relative to the scaled screen for accurate placement
-                pop_up_rect = pop_up_surf.get_rect(center=(self.screen.get_width() // 2, 20)) 
-                pygame.draw.rect(self.screen, (0, 0, 0, 180), pop_up_rect.inflate(10, 5), border_radius=5)
-                self.screen.blit(pop_up_surf, pop_up_rect)
+                pop_up_rect = pop_up_surf.get_rect(center=(SCREEN_WIDTH // 2, 10))
+                surface.blit(pop_up_surf, pop_up_rect)
             
             pygame.display.flip()
 
@@ -539,5 +692,6 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error during run loop: {e}")
     finally:
+        engine.pet.close()
         print("Exiting game. Pygame quit.")
         pygame.quit()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import pygame
 import random
-import time
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, GREEN, RED
+from ui_helpers import is_primary_click, render_text
 
 class CatchTheFoodMinigame:
     """
@@ -11,27 +11,47 @@ class CatchTheFoodMinigame:
         self.font = font
         self.score = 0
         self.game_duration = 20.0
-        self.start_time = time.time()
+        self.elapsed = 0.0 # Seconds played, accumulated from the engine's frame dt
         
         self.player_rect = pygame.Rect(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 50, 50, 20)
         
         self.good_foods = []
         self.bad_foods = []
+        self._free_rects = [] # Rects of caught or fallen food, reused for new spawns
         self.food_speed = 4
         self.food_spawn_timer = 0
         self.food_spawn_interval = 0.4
 
+        # Draw every spawn's x position and kind up front, two batched calls instead of two per spawn.
+        # Spawns are at least food_spawn_interval apart, so this many always covers a whole game.
+        spawn_count = int(self.game_duration / self.food_spawn_interval) + 4
+        spawn_xs = random.choices(range(SCREEN_WIDTH - 20 + 1), k=spawn_count)
+        spawn_is_good = random.choices((True, False), weights=(7, 3), k=spawn_count) # 70% chance of good food
+        self._spawn_plan = iter(zip(spawn_xs, spawn_is_good))
+
         self.is_over = False
         self.game_over_acknowledged = False
 
+        self.game_over_font = pygame.font.Font(None, 40)
+        self._game_over_text = None
+
+        # Solid sprites are filled once and blitted, rather than rasterizing a rect per item per frame
+        self.player_surf = pygame.Surface(self.player_rect.size).convert()
+        self.player_surf.fill(GREEN)
+        self.good_surf = pygame.Surface((20, 20)).convert()
+        self.good_surf.fill(GREEN)
+        self.bad_surf = pygame.Surface((20, 20)).convert()
+        self.bad_surf.fill(RED)
+
     def handle_event(self, event, raw_pos):
-        if self.is_over:
-            if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1) or (event.type == pygame.FINGERDOWN):
-                self.game_over_acknowledged = True
+        if not self.is_over or not is_primary_click(event):
+            return
+        self.game_over_acknowledged = True
 
-    def update(self, mouse_pos):
+    def update(self, mouse_pos, dt):
         if self.is_over:
             return
+        self.elapsed += dt
 
         # Player movement
         self.player_rect.centerx = mouse_pos[0]
@@ -43,37 +63,48 @@ class CatchTheFoodMinigame:
             self.player_rect.right = SCREEN_WIDTH
 
         # Spawn food
-        self.food_spawn_timer += 1/30.0 # Assuming 30 FPS from main loop
+        self.food_spawn_timer += dt
         if self.food_spawn_timer > self.food_spawn_interval:
             self.food_spawn_timer = 0
             self.spawn_food()
 
         # Update good food
-        for food in self.good_foods[:]:
-            food.y += self.food_speed
-            if self.player_rect.colliderect(food):
-                self.good_foods.remove(food)
-                self.score += 1
-            elif food.y > SCREEN_HEIGHT:
-                self.good_foods.remove(food)
+        self.score += self._advance_foods(self.good_foods)
 
         # Update bad food
-        for food in self.bad_foods[:]:
-            food.y += self.food_speed
-            if self.player_rect.colliderect(food):
-                self.bad_foods.remove(food)
-                self.score = max(0, self.score - 2) # Penalty for catching bad food
-            elif food.y > SCREEN_HEIGHT:
-                self.bad_foods.remove(food)
+        caught = self._advance_foods(self.bad_foods)
+        self.score = max(0, self.score - 2 * caught) # Penalty for catching bad food
 
         # Check for game over
-        if time.time() - self.start_time >= self.game_duration:
+        if self.elapsed >= self.game_duration:
             self.is_over = True
             
+    def _advance_foods(self, foods):
+        """Moves foods down one step and drops caught or fallen ones in place; returns the number caught."""
+        for food in foods:
+            food.y += self.food_speed
+        caught = self.player_rect.collidelistall(foods) # One C call for the whole list
+        # Everything falls at the same speed, so the oldest (first) food is the lowest one
+        if caught or (foods and foods[0].y > SCREEN_HEIGHT):
+            caught_indices = set(caught)
+            kept = 0
+            for i, food in enumerate(foods):
+                if i in caught_indices or food.y > SCREEN_HEIGHT:
+                    self._free_rects.append(food) # Recycled by spawn_food
+                else:
+                    foods[kept] = food
+                    kept += 1
+            del foods[kept:]
+        return len(caught)
+
     def spawn_food(self):
-        x = random.randint(0, SCREEN_WIDTH - 20)
-        item_rect = pygame.Rect(x, -20, 20, 20)
-        if random.random() > 0.3: # 70% chance of good food
+        x, is_good = next(self._spawn_plan)
+        if self._free_rects:
+            item_rect = self._free_rects.pop()
+            item_rect.topleft = (x, -20)
+        else:
+            item_rect = pygame.Rect(x, -20, 20, 20)
+        if is_good:
             self.good_foods.append(item_rect)
         else:
             self.bad_foods.append(item_rect)
@@ -81,30 +112,26 @@ class CatchTheFoodMinigame:
     def draw(self, surface):
         surface.fill(BLACK)
         
-        # Draw player
-        pygame.draw.rect(surface, GREEN, self.player_rect)
-
-        # Draw foods
-        for food in self.good_foods:
-            pygame.draw.rect(surface, GREEN, food)
-        for food in self.bad_foods:
-            pygame.draw.rect(surface, RED, food)
+        # Draw player and foods in one batched blit
+        blit_list = [(self.player_surf, self.player_rect)]
+        blit_list.extend([(self.good_surf, food) for food in self.good_foods])
+        blit_list.extend([(self.bad_surf, food) for food in self.bad_foods])
+        surface.blits(blit_list, doreturn=False)
         
         # Draw UI
-        score_text = self.font.render(f"Score: {self.score}", False, WHITE)
+        score_text = render_text(self.font, f"Score: {self.score}", WHITE)
         surface.blit(score_text, (10, 10))
         
-        time_left = self.game_duration - (time.time() - self.start_time)
-        timer_text = self.font.render(f"Time: {int(max(0, time_left))}", False, WHITE)
+        seconds_left = int(max(0, self.game_duration - self.elapsed))
+        timer_text = render_text(self.font, f"Time: {seconds_left}", WHITE)
         surface.blit(timer_text, (SCREEN_WIDTH - timer_text.get_width() - 10, 10))
 
         if self.is_over:
-            game_over_font = pygame.font.Font(None, 40)
-            game_over_text = game_over_font.render("Game Over", False, RED)
-            score_display_text = self.font.render(f"Final Score: {self.score}", False, WHITE)
-            
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 20))
-            score_rect = score_display_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 20))
-
-            surface.blit(game_over_text, game_over_rect)
-            surface.blit(score_display_text, score_rect)
\ No newline at end of file
+            if self._game_over_text is None: # The final score is fixed once the game is over
+                game_over_text = self.game_over_font.render("Game Over", False, RED)
+                score_display_text = self.font.render(f"Final Score: {self.score}", False, WHITE)
+                self._game_over_text = (
+                    (game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 - 20))),
+                    (score_display_text, score_display_text.get_rect(center=(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2 + 20))),
+                )
+            surface.blits(self._game_over_text, doreturn=False)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import math
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from dataclasses import dataclass
 
 class GameState(Enum):
@@ -10,10 +10,12 @@ class GameState(Enum):
     CATCH_THE_FOOD_MINIGAME = auto()
     GARDENING_MINIGAME = auto()
 
-class PetState(Enum):
+class PetState(IntEnum):
     """
     Enforces valid states for the pet behavior engine.
     Includes logic to handle old hyphenated save data names.
+    An IntEnum so the per-frame state comparisons are plain int compares;
+    save data stores the member name, so the int values are never persisted.
     """
     EGG = auto()
     BABY = auto()
@@ -39,10 +41,10 @@ class PetState(Enum):
         if isinstance(value, str):
             normalized = value.replace('-', '_').upper()
             
-            # Check if normalized state exists
-            for member in cls:
-                if member.name == normalized:
-                    return member
+            # Check if normalized state exists (name -> member mapping, no scan)
+            member = cls.__members__.get(normalized)
+            if member is not None:
+                return member
             
             # Fallback for completely removed states (like 'ELITE_CHILD')
             if 'CHILD' in normalized or 'ELITE' in normalized:
@@ -52,9 +54,33 @@ class PetState(Enum):
         return super()._missing_(value)
 
 
-@dataclass
+# --- Decay Rates (per second) ---
+FULL_DECAY_SEC = 8.0 / 3600.0   # 8 units per hour
+FULL_DECAY_SLEEPING_SEC = 2.0 / 3600.0
+HAPPY_DECAY_SEC = 10.0 / 3600.0
+HAPPY_HUNGRY_EXTRA_SEC = 5.0 / 3600.0
+HAPPY_SICK_EXTRA_SEC = 10.0 / 3600.0
+ENERGY_DECAY_SEC = 15.0 / 3600.0
+ENERGY_REGEN_SEC = 30.0 / 3600.0
+ENERGY_NIGHT_DRAIN_FACTOR = 1.5 # 50% increased drain at night if not sleeping
+HEALTH_DECAY_SEC = 10.0 / 3600.0
+HEALTH_REGEN_SEC = 2.0 / 3600.0
+
+# State-dependent rates; states not listed use the default rate
+_FULL_RATE_BY_STATE = {PetState.SLEEPING: FULL_DECAY_SLEEPING_SEC}
+_HAPPY_RATE_BY_STATE = {PetState.SICK: HAPPY_DECAY_SEC + HAPPY_SICK_EXTRA_SEC}
+# Signed energy change per second (before the night factor)
+_ENERGY_RATE_BY_STATE = {
+    PetState.SLEEPING: ENERGY_REGEN_SEC,
+    PetState.PLAYING: -ENERGY_DECAY_SEC * 2, # Double drain
+    PetState.TRAINING: -ENERGY_DECAY_SEC * 2,
+}
+_IS_NIGHT_HOUR = tuple(hour >= 22 or hour < 6 for hour in range(24))
+
+
+@dataclass(slots=True)
 class PetStats:
-    """Uses a linear decay model: Vt = V0 - (r * dt)."""
+    """Uses a linear decay model: Vt = V0 - (r * dt). Slotted: no per-instance __dict__."""
     fullness: float = 50.0  # 100 = Full, 0 = Starving
     happiness: float = 100.0
     energy: float = 100.0
@@ -63,45 +89,44 @@ class PetStats:
     care_mistakes: int = 0
     coins: int = 0
 
-    def clamp(self, value):
+    @staticmethod
+    def clamp(value):
+        """Limits a stat to 0..100. Static, so stats.clamp(v) needs no bound-method creation."""
         return max(0.0, min(100.0, value))
 
     def tick(self, dt: float, current_state: PetState, current_hour: int):
         """Standardized decay logic for real-time passage."""
-        
-        # --- Decay Rates (per second) ---
-        FULL_DECAY_SEC = 8.0 / 3600.0   # 8 units per hour
-        HAPPY_DECAY_SEC = 10.0 / 3600.0
-        ENERGY_DECAY_SEC = 15.0 / 3600.0
-        ENERGY_REGEN_SEC = 30.0 / 3600.0
-        HEALTH_DECAY_SEC = 10.0 / 3600.0
-        HEALTH_REGEN_SEC = 2.0 / 3600.0
 
         # Fullness decay (slower while sleeping)
-        full_rate = FULL_DECAY_SEC if current_state!= PetState.SLEEPING else 2.0 / 3600.0
-        self.fullness = self.clamp(self.fullness - full_rate * dt)
+        fullness = self.fullness - _FULL_RATE_BY_STATE.get(current_state, FULL_DECAY_SEC) * dt
+        self.fullness = fullness = max(0.0, min(100.0, fullness))
         
         # Happiness decay (faster if hungry or sick)
-        happy_rate = HAPPY_DECAY_SEC
-        if self.fullness < 20.0: happy_rate += 5.0 / 3600.0
-        if current_state == PetState.SICK: happy_rate += 10.0 / 3600.0
-        self.happiness = self.clamp(self.happiness - happy_rate * dt)
+        happy_rate = _HAPPY_RATE_BY_STATE.get(current_state, HAPPY_DECAY_SEC)
+        if fullness < 20.0: happy_rate += HAPPY_HUNGRY_EXTRA_SEC
+        self.happiness = max(0.0, min(100.0, self.happiness - happy_rate * dt))
         
         # Energy recovery vs drain
-        energy_drain_rate = ENERGY_DECAY_SEC
-        if (current_hour >= 22 or current_hour < 6) and current_state != PetState.SLEEPING:
-            energy_drain_rate *= 1.5 # 50% increased drain at night if not sleeping
-
-        if current_state == PetState.SLEEPING:
-            self.energy = self.clamp(self.energy + ENERGY_REGEN_SEC * dt)
-        elif current_state == PetState.PLAYING or current_state == PetState.TRAINING:
-            self.energy = self.clamp(self.energy - energy_drain_rate * 2 * dt) # Double drain
-        else:
-            self.energy = self.clamp(self.energy - energy_drain_rate * dt)
+        energy_rate = _ENERGY_RATE_BY_STATE.get(current_state, -ENERGY_DECAY_SEC)
+        if energy_rate < 0 and _IS_NIGHT_HOUR[current_hour]:
+            energy_rate *= ENERGY_NIGHT_DRAIN_FACTOR
+        self.energy = energy = max(0.0, min(100.0, self.energy + energy_rate * dt))
 
         # Health decay
-        if self.fullness == 0 or self.energy == 0 or current_state == PetState.SICK:
-            self.health = self.clamp(self.health - HEALTH_DECAY_SEC * dt)
+        if fullness == 0 or energy == 0 or current_state == PetState.SICK:
+            self.health = max(0.0, min(100.0, self.health - HEALTH_DECAY_SEC * dt))
         elif self.health < 100.0:
             # Slow recovery if well cared for
-            self.health = self.clamp(self.health + HEALTH_REGEN_SEC * dt)
\ No newline at end of file
+            self.health = max(0.0, min(100.0, self.health + HEALTH_REGEN_SEC * dt))
+
+
+@dataclass
+class GardenPlot:
+    """A garden_plots row plus display state derived from it on each garden tick."""
+    plot_id: int
+    plant_id: int # None when the plot is empty
+    plant_time: float
+    last_watered_time: float
+    ready_time: float = math.inf # When the plant can be harvested; inf while empty
+    growth_pct: float = 0.0 # 0..1, refreshed by GardeningGame once per second
+    needs_water: bool = False
@@ -1,18 +1,85 @@
 import time
 import math
+import bisect
 import pygame
 import random
 import os
+import queue
+import threading
+import sqlite3
 import datetime # Add this import
 from models import PetState, PetStats
-from constants import COLOR_PET_BODY, COLOR_PET_EYES, COLOR_HEALTH, COLOR_TEXT, COLOR_SICK, TIME_SCALE_FACTOR 
+from database import DatabaseManager
+from ui_helpers import render_text
+from constants import COLOR_PET_BODY, COLOR_PET_EYES, COLOR_HEALTH, COLOR_TEXT, COLOR_SICK, TIME_SCALE_FACTOR, DEBUG
 
 # --- EVOLUTION TIMES (in real seconds, scaled by TIME_SCALE_FACTOR) ---
 TIME_TO_BABY_SEC = 10.0  # 90 game-seconds (90 / 10)
 TIME_TO_CHILD_SEC = 17280.0 # 2 game-days (2 * 24 * 60 * 60 / 10)
 TIME_TO_TEEN_SEC = 34560.0 # 4 game-days (4 * 24 * 60 * 60 / 10)
 TIME_TO_ADULT_SEC = 60480.0 # 7 game-days (7 * 24 * 60 * 60 / 10)
+
+# Age thresholds in order; the number of thresholds passed is the life stage index below
+LIFE_STAGE_TIMES = (TIME_TO_BABY_SEC, TIME_TO_CHILD_SEC, TIME_TO_TEEN_SEC, TIME_TO_ADULT_SEC)
+_LIFE_STAGE_INDEX = {
+    PetState.EGG: 0, PetState.BABY: 1, PetState.CHILD: 2,
+    PetState.TEEN_GOOD: 3, PetState.TEEN_BAD: 3,
+    PetState.ADULT_GOOD: 4, PetState.ADULT_BAD: 4,
+}
+
+_SPRITES_DIR = os.path.join(os.path.dirname(__file__), "assets", "sprites")
+
+# Decoded sprite sheets shared by every Pet: (path, mtime) -> (sheet surface, frame rects)
+_SHEET_CACHE = {}
+
+def _load_sheet(path, frame_width=64, frame_height=64):
+    """Loads a horizontal sprite sheet once per file version; returns (sheet, frame rects)."""
+    key = (path, os.path.getmtime(path))
+    cached = _SHEET_CACHE.get(key)
+    if cached is None:
+        sheet = pygame.image.load(path).convert_alpha()
+        rects = tuple(pygame.Rect(x, 0, frame_width, frame_height) for x in range(0, sheet.get_width(), frame_width))
+        cached = _SHEET_CACHE[key] = (sheet, rects)
+    return cached
+
 class Pet:
+    # Message templates for state changes; a specific (old, new) pair wins over entering new_state
+    _ENTER_MSG = {
+        PetState.SLEEPING: "{name} is now fast asleep.",
+        PetState.SICK: "Oh no! {name} is feeling sick.",
+        PetState.DEAD: "Alas, {name} has passed away...",
+    }
+    _TRANSITION_MSG = {
+        (PetState.SLEEPING, PetState.IDLE): "{name} woke up! Good morning!",
+        (PetState.SICK, PetState.IDLE): "{name} is feeling better!",
+        (PetState.EGG, PetState.IDLE): "It's a {name}! Welcome to the world!",
+    }
+    # Finished action -> (stat deltas, message template)
+    _ACTION_EFFECTS = {
+        PetState.EATING: ((("fullness", 20), ("health", 5)), "{name} enjoyed the meal! Fullness +20, Health +5."),
+        PetState.PLAYING: ((("happiness", 30), ("energy", -10)), "{name} had a blast! Happiness +30, Energy -10."),
+        PetState.TRAINING: ((("discipline", 15), ("happiness", -5)), "{name} learned something new! Discipline +15, Happiness -5."), # Training can be tiring
+    }
+    # (stat, previous-value attribute, threshold, message) for the "stat just dropped low" warnings
+    _LOW_STAT_RULES = (
+        ("fullness", "prev_fullness", 20, "{name} is feeling very hungry!"),
+        ("happiness", "prev_happiness", 20, "{name} is feeling lonely."),
+        ("energy", "prev_energy", 20, "{name} is very tired."),
+    )
+    _HEALED_MSG = "{name} is feeling much better! Health +20."
+    _HEAL_REFUSED_MSG = "{name} needs more discipline to accept treatment."
+
+    # Animation name -> (sheet, frame source rects), loaded once by preload_assets() and shared by every Pet
+    _SHARED_ANIMATIONS = {}
+
+    @classmethod
+    def preload_assets(cls):
+        """Loads the sprite sheets once. Needs the display mode to be set (convert_alpha)."""
+        if cls._SHARED_ANIMATIONS:
+            return
+        for name, filename in (("idle", "bobo_idle.png"), ("blink", "bobo_blink.png"), ("sleep", "bobo_sleeping-sheet.png")):
+            cls._SHARED_ANIMATIONS[name] = _load_sheet(os.path.join(_SPRITES_DIR, filename))
+
     # ------------------------------------------------------------------
     # FIX #1: Correct __init__ signature (fixes "Pet() takes no arguments")
     # ------------------------------------------------------------------
@@ -22,63 +89,64 @@ class Pet:
         self.stats = PetStats() 
         self.state = PetState.EGG
         self.life_stage = PetState.EGG
+        self._life_idx = 0 # _LIFE_STAGE_INDEX of life_stage
         self.message_callback = message_callback # Store the callback
+        # Reused for log-only messages; the callback copies the text out before returning
+        self._msg_buf = {"text": "", "notify": False}
 
         self.is_alive = True
         self.birth_time = time.time() 
         self.last_update = time.time()
 
+        # Timers advanced by update()'s dt, so the per-frame path never polls the wall clock.
+        # birth_time stays wall-clock because it is persisted; age_sec is derived from it on load.
+        self.save_accumulator = 0.0 # Seconds since the last periodic save
+        self._last_saved_data = None # Snapshot of the last row written, to skip no-op saves
+        # Saves are written by a worker thread so sqlite commits never stall a frame (see _save_worker)
+        self._save_queue = queue.Queue(maxsize=1) # Only the newest snapshot matters
+        self._save_thread = None
+        self.age_sec = 0.0
+
         # Animation State
         self.play_bounce_timer = 0.0
         
         # Egg cracking animation
         self.crack_level = 0.0
+        self._crack_cache_key = None # (cx, cy, radius, rounded crack_level) of _crack_segments
+        self._crack_segments = []
 
-        # Load Sprites
-        base_path = os.path.dirname(__file__)
-        self.sprite_idle = pygame.image.load(os.path.join(base_path, "assets", "sprites", "bobo_idle.png")).convert_alpha()
-        self.sprite_blink = pygame.image.load(os.path.join(base_path, "assets", "sprites", "bobo_blink.png")).convert_alpha()
-        self.sprite_sleeping = pygame.image.load(os.path.join(base_path, "assets", "sprites", "bobo_sleeping-sheet.png")).convert_alpha()
+        # Load Sprites (shared, only the first Pet actually loads them)
+        Pet.preload_assets()
         
         # Animation variables
-        self.idle_animation_frames = []
         self.idle_frame_index = 0
         self.idle_animation_timer = 0
         self.idle_animation_speed = 0.1  # 100ms per frame
 
-        self.blink_animation_frames = []
         self.blink_frame_index = 0
         self.blink_animation_timer = 0
         self.blink_animation_speed = 0.1  # 100ms per frame
         self.is_blinking = False
         self.blink_intervals = [1, 3, 6]
-        self.shuffled_blink_intervals = self.blink_intervals.copy()
-        random.shuffle(self.shuffled_blink_intervals)
+        self.shuffled_blink_intervals = self._build_blink_ring()
         self.current_blink_interval_index = 0
         self.time_to_next_blink = self.shuffled_blink_intervals[self.current_blink_interval_index]
 
-        self.sleep_animation_frames = []
         self.sleep_frame_index = 0
         self.sleep_animation_timer = 0
         self.sleep_animation_speed = 0.2  # 200ms per frame
 
-        # Parse spritesheets
-        sprite_width = 64
-        sprite_height = 64
-        sheet_width_idle = self.sprite_idle.get_width()
-        for x in range(0, sheet_width_idle, sprite_width):
-            frame = self.sprite_idle.subsurface(pygame.Rect(x, 0, sprite_width, sprite_height))
-            self.idle_animation_frames.append(frame)
-
-        sheet_width_blink = self.sprite_blink.get_width()
-        for x in range(0, sheet_width_blink, sprite_width):
-            frame = self.sprite_blink.subsurface(pygame.Rect(x, 0, sprite_width, sprite_height))
-            self.blink_animation_frames.append(frame)
-
-        sheet_width_sleeping = self.sprite_sleeping.get_width()
-        for x in range(0, sheet_width_sleeping, sprite_width):
-            frame = self.sprite_sleeping.subsurface(pygame.Rect(x, 0, sprite_width, sprite_height))
-            self.sleep_animation_frames.append(frame)
+        # Frames are source rects into their sheet; draw blits the sheet with area=frame
+        self.idle_sheet, self.idle_animation_frames = Pet._SHARED_ANIMATIONS["idle"]
+        self.blink_sheet, self.blink_animation_frames = Pet._SHARED_ANIMATIONS["blink"]
+        self.sleep_sheet, self.sleep_animation_frames = Pet._SHARED_ANIMATIONS["sleep"]
+        # Every sheet is sliced into same-size frames, so the centering offset is fixed
+        self.frame_half_width = self.idle_animation_frames[0].width // 2
+        self.frame_half_height = self.idle_animation_frames[0].height // 2
+        # Frame counts never change, so update() doesn't take len() of the frame lists every tick
+        self.idle_frame_count = len(self.idle_animation_frames)
+        self.blink_frame_count = len(self.blink_animation_frames)
+        self.sleep_frame_count = len(self.sleep_animation_frames)
         
         # For tracking previous stats to trigger low stat messages once
         self.prev_fullness = self.stats.fullness
@@ -94,40 +162,41 @@ class Pet:
     def transition_to(self, new_state: PetState):
         if self.state != new_state:
             old_state = self.state
-            print(f"Pet transitioning from {old_state.name} to {new_state.name}")
+            if DEBUG:
+                print(f"Pet transitioning from {old_state.name} to {new_state.name}")
             self.state = new_state
             self.action_timer = 0.0 
 
             # Trigger messages for state changes
             if self.message_callback:
-                if new_state == PetState.SLEEPING:
-                    self.message_callback(f"{self.name} is now fast asleep.")
-                elif old_state == PetState.SLEEPING and new_state == PetState.IDLE:
-                    self.message_callback(f"{self.name} woke up! Good morning!")
-                elif new_state == PetState.SICK:
-                    self.message_callback(f"Oh no! {self.name} is feeling sick.")
-                elif old_state == PetState.SICK and new_state == PetState.IDLE:
-                    self.message_callback(f"{self.name} is feeling better!")
-                elif new_state == PetState.DEAD:
-                    self.message_callback(f"Alas, {self.name} has passed away...")
-                elif new_state == PetState.IDLE and old_state == PetState.EGG: # Check old_state for hatching
-                    self.message_callback(f"It's a {self.name}! Welcome to the world!")
+                template = Pet._TRANSITION_MSG.get((old_state, new_state)) or Pet._ENTER_MSG.get(new_state)
+                if template:
+                    self.message_callback(template.format(name=self.name))
+
+    def _build_blink_ring(self, rounds=64):
+        """Returns `rounds` shuffled copies of blink_intervals back to back, so every interval still appears once per round."""
+        ring = []
+        for _ in range(rounds):
+            intervals = self.blink_intervals.copy()
+            random.shuffle(intervals)
+            ring.extend(intervals)
+        return tuple(ring)
+
+    def _log_message(self, template):
+        """Sends a message to the log without a notification, through the shared message buffer."""
+        if self.message_callback:
+            self._msg_buf["text"] = template.format(name=self.name)
+            self.message_callback(self._msg_buf)
 
     def handle_action_complete(self, action_name: str):
         # self.action_feedback_timer = 2.0 # No longer needed
         
-        if self.state == PetState.EATING:
-            self.stats.fullness = self.stats.clamp(self.stats.fullness + 20)
-            self.stats.health = self.stats.clamp(self.stats.health + 5)
-            if self.message_callback: self.message_callback({"text": f"{self.name} enjoyed the meal! Fullness +20, Health +5.", "notify": False})
-        elif self.state == PetState.PLAYING:
-            self.stats.happiness = self.stats.clamp(self.stats.happiness + 30)
-            self.stats.energy = self.stats.clamp(self.stats.energy - 10)
-            if self.message_callback: self.message_callback({"text": f"{self.name} had a blast! Happiness +30, Energy -10.", "notify": False})
-        elif self.state == PetState.TRAINING:
-            self.stats.discipline = self.stats.clamp(self.stats.discipline + 15)
-            self.stats.happiness = self.stats.clamp(self.stats.happiness - 5) # Training can be tiring
-            if self.message_callback: self.message_callback({"text": f"{self.name} learned something new! Discipline +15, Happiness -5.", "notify": False})
+        effect = Pet._ACTION_EFFECTS.get(self.state)
+        if effect:
+            deltas, template = effect
+            for stat, delta in deltas:
+                setattr(self.stats, stat, self.stats.clamp(getattr(self.stats, stat) + delta))
+            self._log_message(template)
         
         self.transition_to(PetState.IDLE)
         
@@ -136,10 +205,10 @@ class Pet:
             if self.stats.discipline >= 10:
                 self.stats.health = self.stats.clamp(self.stats.health + 20)
                 self.stats.discipline = self.stats.clamp(self.stats.discipline - 10)
-                if self.message_callback: self.message_callback({"text": f"{self.name} is feeling much better! Health +20.", "notify": False})
+                self._log_message(Pet._HEALED_MSG)
                 self.transition_to(PetState.IDLE)
             else:
-                if self.message_callback: self.message_callback({"text": f"{self.name} needs more discipline to accept treatment.", "notify": False})
+                self._log_message(Pet._HEAL_REFUSED_MSG)
 
 
     def update(self, dt, current_hour):
@@ -150,6 +219,8 @@ class Pet:
         if not self.is_alive and self.state == PetState.DEAD:
             return
 
+        self.age_sec += dt
+
         # 1. Update action timer (Use real dt for fixed action duration)
         if self.state in [PetState.EATING, PetState.PLAYING, PetState.TRAINING]:
             self.action_timer += dt 
@@ -159,27 +230,28 @@ class Pet:
         # 2. Update Stats (Use scaled_dt for accelerated decay)
         self.stats.tick(scaled_dt, self.state, current_hour)
         
-        # Trigger messages for low stats
-        if self.message_callback:
-            if self.stats.fullness < 20 and self.prev_fullness >= 20:
-                self.message_callback(f"{self.name} is feeling very hungry!")
-            if self.stats.happiness < 20 and self.prev_happiness >= 20:
-                self.message_callback(f"{self.name} is feeling lonely.")
-            if self.stats.energy < 20 and self.prev_energy >= 20:
-                self.message_callback(f"{self.name} is very tired.")
-        
-        self.prev_fullness = self.stats.fullness
-        self.prev_happiness = self.stats.happiness
-        self.prev_energy = self.stats.energy
+        # Trigger messages for low stats (nothing can cross a threshold if none of them moved)
+        stats = self.stats
+        if (stats.fullness, stats.happiness, stats.energy) != (self.prev_fullness, self.prev_happiness, self.prev_energy):
+            if self.message_callback:
+                for stat, prev_attr, threshold, template in Pet._LOW_STAT_RULES:
+                    if getattr(stats, stat) < threshold <= getattr(self, prev_attr):
+                        self.message_callback(template.format(name=self.name))
+            
+            self.prev_fullness = stats.fullness
+            self.prev_happiness = stats.happiness
+            self.prev_energy = stats.energy
         
         # 3. Handle Animation Timers (Use real dt for smooth visuals)
+        # Timers subtract one frame's duration per step, so a long frame carries its overshoot forward
 
         # Update idle animation
         if not self.is_blinking:
             self.idle_animation_timer += dt
-            if self.idle_animation_timer >= self.idle_animation_speed:
-                self.idle_animation_timer = 0
-                self.idle_frame_index = (self.idle_frame_index + 1) % len(self.idle_animation_frames)
+            while self.idle_animation_timer >= self.idle_animation_speed:
+                self.idle_animation_timer -= self.idle_animation_speed
+                next_index = self.idle_frame_index + 1
+                self.idle_frame_index = next_index if next_index < self.idle_frame_count else 0
 
         # Blinking logic
         if self.state != PetState.SLEEPING:
@@ -190,22 +262,23 @@ class Pet:
                     self.blink_animation_timer = 0
             else:
                 self.blink_animation_timer += dt
-                if self.blink_animation_timer >= self.blink_animation_speed:
-                    self.blink_animation_timer = 0
+                while self.is_blinking and self.blink_animation_timer >= self.blink_animation_speed:
+                    self.blink_animation_timer -= self.blink_animation_speed
                     self.blink_frame_index += 1
-                    if self.blink_frame_index >= len(self.blink_animation_frames):
+                    if self.blink_frame_index >= self.blink_frame_count:
                         self.is_blinking = False
                         self.blink_frame_index = 0
                         self.current_blink_interval_index += 1
                         if self.current_blink_interval_index >= len(self.shuffled_blink_intervals):
-                            random.shuffle(self.shuffled_blink_intervals)
+                            self.shuffled_blink_intervals = self._build_blink_ring()
                             self.current_blink_interval_index = 0
                         self.time_to_next_blink = self.shuffled_blink_intervals[self.current_blink_interval_index]
         elif self.state == PetState.SLEEPING:
             self.sleep_animation_timer += dt
-            if self.sleep_animation_timer >= self.sleep_animation_speed:
-                self.sleep_animation_timer = 0
-                self.sleep_frame_index = (self.sleep_frame_index + 1) % len(self.sleep_animation_frames)
+            while self.sleep_animation_timer >= self.sleep_animation_speed:
+                self.sleep_animation_timer -= self.sleep_animation_speed
+                next_index = self.sleep_frame_index + 1
+                self.sleep_frame_index = next_index if next_index < self.sleep_frame_count else 0
 
         # 4. State Checks and Evolution
         
@@ -225,41 +298,66 @@ class Pet:
              self.transition_to(PetState.IDLE) 
             
         # Life Stage check (based on total accumulated game time)
-        total_game_time = (time.time() - self.birth_time) * TIME_SCALE_FACTOR
+        total_game_time = self.age_sec * TIME_SCALE_FACTOR
         
-        if self.life_stage == PetState.EGG and total_game_time > TIME_TO_BABY_SEC:
-            self.life_stage = PetState.BABY
-            self.transition_to(PetState.IDLE)
-            if self.message_callback: self.message_callback(f"Congratulations! {self.name} has hatched into a Baby!")
-            self.save() # Ensure the life stage change is saved
-        elif self.life_stage == PetState.BABY and total_game_time > TIME_TO_CHILD_SEC:
-            self.life_stage = PetState.CHILD
-            self.transition_to(PetState.IDLE)
-            if self.message_callback: self.message_callback(f"{self.name} has grown into a Child!")
-        elif self.life_stage == PetState.CHILD and total_game_time > TIME_TO_TEEN_SEC:
-            if self.stats.care_mistakes < 3 and self.stats.discipline > 50:
-                self.life_stage = PetState.TEEN_GOOD
-                if self.message_callback: self.message_callback(f"{self.name} evolved into a well-behaved Teen!")
-            else:
-                self.life_stage = PetState.TEEN_BAD
-                if self.message_callback: self.message_callback(f"{self.name} evolved into a rebellious Teen...")
-            self.transition_to(PetState.IDLE)
-        elif self.life_stage in [PetState.TEEN_GOOD, PetState.TEEN_BAD] and total_game_time > TIME_TO_ADULT_SEC:
-            if self.stats.care_mistakes < 5 and self.stats.happiness > 75:
-                self.life_stage = PetState.ADULT_GOOD
-                if self.message_callback: self.message_callback(f"Amazing! {self.name} is now a thriving Adult!")
-            else:
-                self.life_stage = PetState.ADULT_BAD
-                if self.message_callback: self.message_callback(f"{self.name} has reached adulthood, but seems a bit rough around the edges.")
-            self.transition_to(PetState.IDLE)
+        # bisect_left counts the thresholds strictly below the age, matching the "> TIME_TO_*" checks
+        if bisect.bisect_left(LIFE_STAGE_TIMES, total_game_time) > self._life_idx:
+            self._advance_life()
 
 
         # 5. Save state every few seconds
-        if time.time() - self.last_update > 5: 
+        self.save_accumulator += dt
+        if self.save_accumulator > 5: 
             self.save()
-            self.last_update = time.time()
+            self.save_accumulator = 0.0
+            # update() only runs on the pet view, so re-anchor to birth_time to count time spent in menus and games
+            self.age_sec = max(0.0, time.time() - self.birth_time)
+
+    def _advance_life(self):
+        """Evolves the pet one life stage; update() calls it again on later frames if the pet is still behind."""
+        handler = Pet._EVOLUTION_TABLE.get(self.life_stage)
+        if handler:
+            handler(self)
+        self._life_idx = _LIFE_STAGE_INDEX.get(self.life_stage, len(LIFE_STAGE_TIMES))
+
+    def _hatch(self):
+        self.life_stage = PetState.BABY
+        self.transition_to(PetState.IDLE)
+        if self.message_callback: self.message_callback(f"Congratulations! {self.name} has hatched into a Baby!")
+        self.save() # Ensure the life stage change is saved
+
+    def _grow_to_child(self):
+        self.life_stage = PetState.CHILD
+        self.transition_to(PetState.IDLE)
+        if self.message_callback: self.message_callback(f"{self.name} has grown into a Child!")
+
+    def _grow_to_teen(self):
+        if self.stats.care_mistakes < 3 and self.stats.discipline > 50:
+            self.life_stage = PetState.TEEN_GOOD
+            if self.message_callback: self.message_callback(f"{self.name} evolved into a well-behaved Teen!")
+        else:
+            self.life_stage = PetState.TEEN_BAD
+            if self.message_callback: self.message_callback(f"{self.name} evolved into a rebellious Teen...")
+        self.transition_to(PetState.IDLE)
+
+    def _grow_to_adult(self):
+        if self.stats.care_mistakes < 5 and self.stats.happiness > 75:
+            self.life_stage = PetState.ADULT_GOOD
+            if self.message_callback: self.message_callback(f"Amazing! {self.name} is now a thriving Adult!")
+        else:
+            self.life_stage = PetState.ADULT_BAD
+            if self.message_callback: self.message_callback(f"{self.name} has reached adulthood, but seems a bit rough around the edges.")
+        self.transition_to(PetState.IDLE)
+
+    # Current life stage -> evolution step; stages missing here (adults) don't evolve further
+    _EVOLUTION_TABLE = {
+        PetState.EGG: _hatch,
+        PetState.BABY: _grow_to_child,
+        PetState.CHILD: _grow_to_teen,
+        PetState.TEEN_GOOD: _grow_to_adult,
+        PetState.TEEN_BAD: _grow_to_adult,
+    }
 
-   
     # ------------------------------------------------------------------
     def load(self):
 
@@ -280,7 +378,9 @@ class Pet:
                 self.is_alive = bool(row[7])
                 self.birth_time = row[8]
                 self.last_update = row[9]
+                self.age_sec = max(0.0, time.time() - self.birth_time)
                 self.life_stage = PetState[row[10]]
+                self._life_idx = _LIFE_STAGE_INDEX.get(self.life_stage, len(LIFE_STAGE_TIMES))
                 self.state = PetState[row[11]]
                 if len(row) > 12: 
                     self.name = row[12]
@@ -296,8 +396,10 @@ class Pet:
             self.stats = PetStats() 
             self.state = PetState.EGG
             self.life_stage = PetState.EGG
+            self._life_idx = 0
             self.birth_time = time.time()
             self.last_update = time.time()
+            self.age_sec = 0.0
             if self.message_callback: self.message_callback(f"A new {self.name} egg has appeared!")
 
     def save(self):
@@ -316,7 +418,46 @@ class Pet:
             'name': self.name,
             'coins': self.stats.coins
         }
-        self.db.save_pet(pet_data)
+        # Stats pinned at their limits (e.g. a full pet asleep) leave nothing new to write
+        if pet_data == self._last_saved_data:
+            return
+
+        if self._save_thread is None or not self._save_thread.is_alive():
+            self._save_thread = threading.Thread(target=self._save_worker, args=(self.db.db_path,), name="pet-save", daemon=True)
+            self._save_thread.start()
+        try:
+            self._save_queue.put_nowait(pet_data)
+        except queue.Full:
+            # The writer is behind; replace the pending snapshot, this one supersedes it
+            try:
+                self._save_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._save_queue.put_nowait(pet_data)
+
+    def _save_worker(self, db_path):
+        """Writes queued snapshots until close() sends None. sqlite connections are per-thread, so it opens its own."""
+        db = DatabaseManager(db_path, initialize=False)
+        while True:
+            pet_data = self._save_queue.get()
+            if pet_data is None:
+                break
+            try:
+                db.save_pet(pet_data)
+            except sqlite3.Error as e:
+                # Keep running; _last_saved_data is left as is, so the next save() retries this state
+                print(f"Error saving pet: {e}")
+                continue
+            self._last_saved_data = pet_data
+        db.conn.close()
+
+    def close(self):
+        """Flushes pending saves and stops the save thread."""
+        if self._save_thread is not None:
+            if self._save_thread.is_alive(): # A dead worker would never drain the queue for the sentinel
+                self._save_queue.put(None)
+                self._save_thread.join()
+            self._save_thread = None
     
     # --- Drawing Logic (Retained animation updates) ---
     def _draw_body(self, surface, cx, cy, radius, color, scale_x=1.0, scale_y=1.0):
@@ -349,6 +490,18 @@ class Pet:
         egg_rect = pygame.Rect(cx - radius, cy - radius * 1.5, radius * 2, radius * 3)
         pygame.draw.ellipse(surface, egg_color, egg_rect)
 
+        # Crack geometry only changes as crack_level creeps up, so the segments are kept per 0.01 step
+        key = (cx, cy, radius, round(crack_level, 2))
+        if key != self._crack_cache_key:
+            self._crack_cache_key = key
+            self._crack_segments = self._crack_geometry(cx, cy, radius, key[3])
+        for start, end in self._crack_segments:
+            pygame.draw.line(surface, crack_color, start, end, 2)
+
+    @staticmethod
+    def _crack_geometry(cx, cy, radius, crack_level):
+        """Returns the crack as a list of (start, end) line segments."""
+        segments = []
         # Main crack line (grows with crack_level)
         if crack_level > 0:
             # Crack from top-ish to bottom-ish
@@ -356,18 +509,19 @@ class Pet:
             start_y = cy - radius * (1.2 - crack_level * 0.5) 
             end_x = cx + (radius * 0.3 * math.sin(crack_level * math.pi * 3 + math.pi/2))
             end_y = cy + radius * (1.2 - (1-crack_level) * 0.5)
-            pygame.draw.line(surface, crack_color, (start_x, start_y), (end_x, end_y), 2)
+            segments.append(((start_x, start_y), (end_x, end_y)))
             
             # Branches for the crack
             if crack_level > 0.3:
                 branch1_x = start_x + (end_x - start_x) * 0.3
                 branch1_y = start_y + (end_y - start_y) * 0.3
-                pygame.draw.line(surface, crack_color, (branch1_x, branch1_y), (branch1_x - radius * 0.5 * crack_level, branch1_y - radius * 0.2 * crack_level), 2)
+                segments.append(((branch1_x, branch1_y), (branch1_x - radius * 0.5 * crack_level, branch1_y - radius * 0.2 * crack_level)))
             
             if crack_level > 0.6:
                 branch2_x = start_x + (end_x - start_x) * 0.7
                 branch2_y = start_y + (end_y - start_y) * 0.7
-                pygame.draw.line(surface, crack_color, (branch2_x, branch2_y), (branch2_x + radius * 0.4 * crack_level, branch2_y - radius * 0.3 * crack_level), 2)
+                segments.append(((branch2_x, branch2_y), (branch2_x + radius * 0.4 * crack_level, branch2_y - radius * 0.3 * crack_level)))
+        return segments
         
     def draw(self, surface, cx, cy, font):
         """Draws the pet, applying visual modifications based on state and health."""
@@ -381,13 +535,13 @@ class Pet:
             dead_sprite_width = 64
             dead_sprite_height = 64
             pygame.draw.ellipse(surface, dead_color, (cx - dead_sprite_width // 2, cy - dead_sprite_height // 4 + 10, dead_sprite_width, dead_sprite_height // 2))
-            dead_text = font.render("REST IN PEACE", False, (255, 0, 0))
+            dead_text = render_text(font, "REST IN PEACE", (255, 0, 0))
             text_rect = dead_text.get_rect(center=(cx, cy))
             surface.blit(dead_text, text_rect)
             return
         
         if self.life_stage == PetState.EGG:
-            time_elapsed_game = (time.time() - self.birth_time) * TIME_SCALE_FACTOR
+            time_elapsed_game = self.age_sec * TIME_SCALE_FACTOR
             self.crack_level = min(1.0, time_elapsed_game / TIME_TO_BABY_SEC)
             
             # For egg drawing, we still use procedural shapes
@@ -399,24 +553,22 @@ class Pet:
             seconds = time_left % 60
             time_str = f"{minutes:02d}:{seconds:02d}"
 
-            egg_text = font.render(time_str, False, COLOR_TEXT)
+            egg_text = render_text(font, time_str)
             # Position the text to the left of the egg
             text_rect = egg_text.get_rect(midright=(cx - egg_radius - 10, cy))
             surface.blit(egg_text, text_rect)
             return # Ensure nothing else is drawn when in EGG state
         
         # For all other states, draw the current pet sprite (idle or blinking)
-        current_sprite_frame = None
         if self.state == PetState.SLEEPING:
-            current_sprite_frame = self.sleep_animation_frames[self.sleep_frame_index]
+            sheet, frame_rect = self.sleep_sheet, self.sleep_animation_frames[self.sleep_frame_index]
         elif self.is_blinking:
-            current_sprite_frame = self.blink_animation_frames[self.blink_frame_index]
+            sheet, frame_rect = self.blink_sheet, self.blink_animation_frames[self.blink_frame_index]
         else:
-            current_sprite_frame = self.idle_animation_frames[self.idle_frame_index]
+            sheet, frame_rect = self.idle_sheet, self.idle_animation_frames[self.idle_frame_index]
         
         # Apply idle bobbing animation to the sprite's position
         sprite_center_y = cy
-        sprite_rect = current_sprite_frame.get_rect(center=(cx, sprite_center_y))
-        surface.blit(current_sprite_frame, sprite_rect)
+        surface.blit(sheet, (cx - self.frame_half_width, sprite_center_y - self.frame_half_height), frame_rect)
         
         # --- Action Feedback Overlay ---
\ No newline at end of file
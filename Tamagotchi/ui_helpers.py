@@ -0,0 +1,23 @@
+import functools
+import pygame
+from constants import COLOR_TEXT
+
+_CLICK_EVENT_TYPES = frozenset((pygame.MOUSEBUTTONDOWN, pygame.FINGERDOWN))
+
+def is_primary_click(event):
+    """True for a left mouse press or a touch. A tap also arrives as an emulated mouse press; only its FINGERDOWN counts."""
+    if event.type not in _CLICK_EVENT_TYPES:
+        return False
+    if event.type == pygame.MOUSEBUTTONDOWN and (event.button != 1 or getattr(event, "touch", False)):
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=512)
+def render_text(font, text, color=COLOR_TEXT, antialias=False):
+    """
+    Memoized font.render. Labels and stat percentages repeat from frame to
+    frame, so each distinct (font, text, color) is rasterized only once.
+    The returned surface is shared and must not be drawn on.
+    """
+    return font.render(text, antialias, color).convert_alpha()